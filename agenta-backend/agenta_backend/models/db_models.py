@@ -276,6 +276,13 @@ class EvaluationDB(Document):
 
     class Settings:
         name = "new_evaluations"
+        indexes = ["variant", "testset.$id", "evaluators_configs"]
+
+
+class EvaluationIdView(BaseModel):
+    """Projection of an evaluation onto its ID"""
+
+    id: PydanticObjectId = Field(alias="_id")
 
 
 class EvaluationScenarioDB(Document):
@@ -1,45 +1,297 @@
+import json
+import asyncio
 import secrets
+import functools
 import logging
-from typing import Any, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple
 
-from fastapi.responses import JSONResponse
-from fastapi import HTTPException, Request, status, Response, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi import Depends, HTTPException, Request, status, Response, Query
 
 from agenta_backend.models import converters
 from agenta_backend.tasks.evaluations import evaluate
-from agenta_backend.utils.common import APIRouter, isCloudEE
-from agenta_backend.services import evaluation_service, db_manager
+from agenta_backend.utils.common import APIRouter, ServerErrorRoute, isCloudEE
+from agenta_backend.services import evaluation_service, db_manager, cache_service
 from agenta_backend.models.api.evaluation_model import (
     Evaluation,
     EvaluationScenario,
     NewEvaluation,
     DeleteEvaluation,
     EvaluationWebhook,
+    EvaluationStatusEnum,
 )
+from agenta_backend.models.db_models import AppDB, EvaluationDB, Error, Result
 from agenta_backend.services.evaluator_manager import (
     check_ai_critique_inputs,
 )
 
-if isCloudEE():
+# the deployment mode is fixed for the lifetime of the process
+IS_CLOUD_EE = isCloudEE()
+
+if IS_CLOUD_EE:
     from agenta_backend.commons.models.db_models import Permission
     from agenta_backend.commons.utils.permissions import check_action_access
 
 from beanie import PydanticObjectId as ObjectId
 
 
-router = APIRouter()
+router = APIRouter(route_class=ServerErrorRoute)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# fetches currently running on behalf of concurrent requests, see coalesce
+inflight_fetches: Dict[Tuple[str, ...], asyncio.Task] = {}
+
+# Payloads derived from a finished evaluation no longer change, so they can be
+# kept for longer than the list of evaluations, which reflects running jobs.
+EVALUATION_CACHE_TTL = 300
+EVALUATIONS_LIST_CACHE_TTL = 5
+TERMINAL_EVALUATION_STATUSES = (
+    EvaluationStatusEnum.EVALUATION_FINISHED,
+    EvaluationStatusEnum.EVALUATION_FINISHED_WITH_ERRORS,
+    EvaluationStatusEnum.EVALUATION_FAILED,
+)
+PERMISSION_DENIED_MESSAGE = "You do not have permission to perform this action. Please contact your organization admin."
+
+
+def is_evaluation_terminal(evaluation) -> bool:
+    """Checks whether the evaluation job is done running."""
+
+    return evaluation.status.value in TERMINAL_EVALUATION_STATUSES
+
+
+async def check_bulk_action_access(
+    request: Request,
+    permission,
+    objects: List[Any] = None,
+    object_ids: List[str] = None,
+    object_type: str = None,
+) -> bool:
+    """Checks whether the user of the request has a permission on all objects.
+
+    Each distinct object is checked once. The checks run concurrently and the
+    remaining ones are cancelled as soon as one of them is denied.
+
+    Args:
+        request (Request): the request object
+        permission (Permission): the permission to check
+        objects (List[Any]): the objects to check the permission against
+        object_ids (List[str]): the IDs of the objects, when they are not fetched
+        object_type (str): the type of the objects, when they are not fetched
+
+    Returns:
+        bool: whether the user has the permission on every object
+    """
+
+    if objects is not None:
+        distinct_objects = {str(object.id): object for object in objects}
+        checks = [
+            check_action_access(
+                user_uid=request.state.user_id,
+                object=object,
+                permission=permission,
+            )
+            for object in distinct_objects.values()
+        ]
+    else:
+        checks = [
+            check_action_access(
+                user_uid=request.state.user_id,
+                object_id=object_id,
+                object_type=object_type,
+                permission=permission,
+            )
+            for object_id in set(object_ids)
+        ]
+
+    pending = {asyncio.ensure_future(check) for check in checks}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # retrieve every exception before raising so none goes unretrieved
+            errors = [task.exception() for task in done]
+            for error in errors:
+                if error is not None:
+                    raise error
+            if not all(task.result() for task in done):
+                return False
+        return True
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def coalesce(key: Tuple[str, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Runs a fetch once for all the concurrent requests sharing the same key.
+
+    The first request starts the fetch, the ones arriving while it runs await
+    its result instead of issuing the same queries again.
+
+    Args:
+        key (Tuple[str, ...]): identifies the fetched data
+        fetch (Callable[[], Awaitable[Any]]): performs the fetch
+
+    Returns:
+        the result of the fetch
+    """
+
+    task = inflight_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight_fetches[key] = task
+        task.add_done_callback(lambda _: inflight_fetches.pop(key, None))
+
+    # shielded so that a cancelled request does not cancel the fetch of others
+    return await asyncio.shield(task)
+
+
+async def stream_json_array(items: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """Encodes the items of an async iterator as a JSON array, one item at a time.
+
+    Items are encoded with the same settings as JSONResponse. The status of a
+    streamed response is sent before the first item, so an error while
+    iterating cannot become an error response: it is logged and re-raised,
+    which aborts the response and leaves the client with a truncated body.
+
+    Args:
+        items (AsyncIterator[Any]): the items to encode
+
+    Yields:
+        bytes: fragments of the JSON array
+    """
+
+    yield b"["
+    separator = b""
+    try:
+        async for item in items:
+            yield separator + json.dumps(
+                jsonable_encoder(item),
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            separator = b","
+    except Exception:
+        logger.exception("Failed to stream JSON array, aborting the response")
+        raise
+    yield b"]"
+
+
+async def ensure_permission(
+    request: Request, permission_name: str, **target: Any
+) -> None:
+    """Checks that the user of the request has a permission on the target of \
+        an action. Nothing is checked outside of cloud/EE deployments.
+
+    Args:
+        request (Request): the request object
+        permission_name (str): the name of the Permission to check
+        **target: the object, or object_id and object_type, to check the
+            permission against, or the objects, or object_ids and object_type,
+            to check it against all at once
+
+    Raises:
+        HTTPException: 403 if the user does not have the permission
+    """
+
+    if not IS_CLOUD_EE:
+        return
+
+    permission = Permission[permission_name]
+    if "objects" in target or "object_ids" in target:
+        has_permission = await check_bulk_action_access(
+            request=request, permission=permission, **target
+        )
+    else:
+        has_permission = await check_action_access(
+            user_uid=request.state.user_id, permission=permission, **target
+        )
+    logger.debug("User has permission %s: %s", permission_name, has_permission)
+    if not has_permission:
+        logger.error(PERMISSION_DENIED_MESSAGE)
+        raise HTTPException(status_code=403, detail=PERMISSION_DENIED_MESSAGE)
+
+
+def fetch_evaluation_with_permission(permission_name: str):
+    """Builds a dependency fetching the evaluation of the route and checking \
+        that the user of the request has the given permission on it.
+
+    Args:
+        permission_name (str): the name of the Permission to check
+
+    Returns:
+        the dependency, resolving to the fetched evaluation
+    """
+
+    async def dependency(evaluation_id: str, request: Request) -> EvaluationDB:
+        evaluation = await coalesce(
+            ("evaluation", evaluation_id),
+            lambda: db_manager.fetch_evaluation_by_id(evaluation_id),
+        )
+        if evaluation is None:
+            raise HTTPException(status_code=404, detail="Evaluation not found")
+
+        await ensure_permission(request, permission_name, object=evaluation)
+        return evaluation
+
+    return dependency
+
+
+def fetch_app_with_permission(permission_name: str):
+    """Builds a dependency fetching the app given by the app_id query parameter \
+        and checking that the user of the request has the given permission on it.
+
+    Args:
+        permission_name (str): the name of the Permission to check
+
+    Returns:
+        the dependency, resolving to the fetched app
+    """
+
+    async def dependency(app_id: str, request: Request) -> AppDB:
+        app = await coalesce(
+            ("app", app_id), lambda: db_manager.fetch_app_by_id(app_id)
+        )
+        if app is None:
+            raise HTTPException(status_code=404, detail="App not found")
+
+        await ensure_permission(request, permission_name, object=app)
+        return app
+
+    return dependency
+
+
+def check_app_permission(permission_name: str):
+    """Builds a dependency checking that the user of the request has the given \
+        permission on the app given by the app_id query parameter, without
+        fetching the app.
+
+    Args:
+        permission_name (str): the name of the Permission to check
+
+    Returns:
+        the dependency
+    """
+
+    async def dependency(app_id: str, request: Request) -> None:
+        await ensure_permission(
+            request, permission_name, object_id=app_id, object_type="app"
+        )
+
+    return dependency
 
 
 @router.get(
     "/by_resource/",
     response_model=List[ObjectId],
+    dependencies=[Depends(check_app_permission("VIEW_EVALUATION"))],
 )
 async def fetch_evaluation_ids(
     app_id: str,
     resource_type: str,
-    request: Request,
     resource_ids: List[str] = Query(None),
 ):
     """Fetches evaluation ids for a given resource type and id.
@@ -55,30 +307,11 @@ async def fetch_evaluation_ids(
     Returns:
         List[str]: A list of evaluation ids.
     """
-    try:
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object_id=app_id,
-                object_type="app",
-                permission=Permission.VIEW_EVALUATION,
-            )
-            logger.debug(
-                f"User has permission to get single evaluation: {has_permission}"
-            )
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
-        evaluations = await evaluation_service.fetch_evaluations_by_resource(
-            resource_type, resource_ids
-        )
-        return list(map(lambda x: x.id, evaluations))
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    evaluations = await evaluation_service.fetch_evaluations_by_resource(
+        resource_type, resource_ids
+    )
+    # already serializable, returning a response skips re-validating each id
+    return JSONResponse([str(evaluation.id) for evaluation in evaluations])
 
 
 @router.post("/", response_model=List[Evaluation], operation_id="create_evaluation")
@@ -97,20 +330,7 @@ async def create_evaluation(
         if app is None:
             raise HTTPException(status_code=404, detail="App not found")
 
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object=app,
-                permission=Permission.CREATE_EVALUATION,
-            )
-            logger.debug(f"User has permission to create evaluation: {has_permission}")
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
+        await ensure_permission(request, "CREATE_EVALUATION", object=app)
 
         success, response = await check_ai_critique_inputs(
             payload.evaluators_configs, payload.lm_providers_keys
@@ -118,34 +338,74 @@ async def create_evaluation(
         if not success:
             return response
 
-        evaluations = []
         correct_answer_column = (
             "correct_answer"
             if payload.correct_answer_column is None
             else payload.correct_answer_column
         )
 
-        for variant_id in payload.variant_ids:
+        # evaluate.delay publishes to the broker synchronously, run it in the
+        # default executor so that it does not block the event loop
+        loop = asyncio.get_running_loop()
+        rate_limit_config = payload.rate_limit.dict()
+
+        async def create_and_start_evaluation(variant_id: str) -> Evaluation:
             evaluation = await evaluation_service.create_new_evaluation(
                 app_id=payload.app_id,
                 variant_id=variant_id,
                 evaluator_config_ids=payload.evaluators_configs,
                 testset_id=payload.testset_id,
             )
+            try:
+                await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        evaluate.delay,
+                        app_id=payload.app_id,
+                        variant_id=variant_id,
+                        evaluators_config_ids=payload.evaluators_configs,
+                        testset_id=payload.testset_id,
+                        evaluation_id=evaluation.id,
+                        rate_limit_config=rate_limit_config,
+                        lm_providers_keys=payload.lm_providers_keys,
+                        correct_answer_column=correct_answer_column,
+                    ),
+                )
+            except Exception as exc:
+                # without a task the evaluation would show as running forever
+                await db_manager.update_evaluation(
+                    evaluation_id=evaluation.id,
+                    updates={
+                        "status": Result(
+                            type="status",
+                            value=EvaluationStatusEnum.EVALUATION_FAILED,
+                            error=Error(
+                                message="Failed to start evaluation",
+                                stacktrace=str(exc),
+                            ),
+                        )
+                    },
+                )
+                raise
+            return evaluation
+
+        # every created evaluation gets its task dispatched even if the
+        # creation of another one fails, the first failure is raised afterwards
+        results = await asyncio.gather(
+            *[
+                create_and_start_evaluation(variant_id)
+                for variant_id in payload.variant_ids
+            ],
+            return_exceptions=True,
+        )
+        await cache_service.invalidate(
+            cache_service.app_evaluations_key(payload.app_id)
+        )
 
-            evaluate.delay(
-                app_id=payload.app_id,
-                variant_id=variant_id,
-                evaluators_config_ids=payload.evaluators_configs,
-                testset_id=payload.testset_id,
-                evaluation_id=evaluation.id,
-                rate_limit_config=payload.rate_limit.dict(),
-                lm_providers_keys=payload.lm_providers_keys,
-                correct_answer_column=correct_answer_column,
-            )
-            evaluations.append(evaluation)
-
-        return evaluations
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
     except KeyError:
         raise HTTPException(
             status_code=400,
@@ -154,78 +414,57 @@ async def create_evaluation(
 
 
 @router.get("/{evaluation_id}/status/", operation_id="fetch_evaluation_status")
-async def fetch_evaluation_status(evaluation_id: str, request: Request):
+async def fetch_evaluation_status(
+    evaluation_id: str,
+    evaluation: EvaluationDB = Depends(
+        fetch_evaluation_with_permission("VIEW_EVALUATION")
+    ),
+):
     """Fetches the status of the evaluation.
 
     Args:
         evaluation_id (str): the evaluation id
-        request (Request): the request object
+        evaluation (EvaluationDB): the evaluation, fetched by the dependency
 
     Returns:
         (str): the evaluation status
     """
 
-    try:
-        evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id)
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object=evaluation,
-                permission=Permission.VIEW_EVALUATION,
-            )
-            logger.debug(
-                f"User has permission to fetch evaluation status: {has_permission}"
-            )
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
-
-        return {"status": evaluation.status}
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    return {"status": evaluation.status}
 
 
 @router.get("/{evaluation_id}/results/", operation_id="fetch_evaluation_results")
-async def fetch_evaluation_results(evaluation_id: str, request: Request):
+async def fetch_evaluation_results(
+    evaluation_id: str,
+    evaluation: EvaluationDB = Depends(
+        fetch_evaluation_with_permission("VIEW_EVALUATION")
+    ),
+):
     """Fetches the results of the evaluation
 
     Args:
         evaluation_id (str): the evaluation id
-        request (Request): the request object
+        evaluation (EvaluationDB): the evaluation, fetched by the dependency
 
     Returns:
         _type_: _description_
     """
 
-    try:
-        evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id)
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object=evaluation,
-                permission=Permission.VIEW_EVALUATION,
-            )
-            logger.debug(
-                f"User has permission to get evaluation results: {has_permission}"
-            )
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
+    is_terminal = is_evaluation_terminal(evaluation)
+    cache_key = cache_service.evaluation_key(evaluation_id, "results")
+    if is_terminal:
+        cached_results = await cache_service.get_cached(cache_key)
+        if cached_results is not None:
+            return cached_results
 
-        results = await converters.aggregated_result_to_pydantic(
-            evaluation.aggregated_results
-        )
-        return {"results": results, "evaluation_id": evaluation_id}
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    results = await coalesce(
+        ("results", evaluation_id),
+        lambda: converters.aggregated_result_to_pydantic(evaluation.aggregated_results),
+    )
+    response = {"results": results, "evaluation_id": evaluation_id}
+    if is_terminal:
+        await cache_service.set_cached(cache_key, response, EVALUATION_CACHE_TTL)
+    return response
 
 
 @router.get(
@@ -235,7 +474,9 @@ async def fetch_evaluation_results(evaluation_id: str, request: Request):
 )
 async def fetch_evaluation_scenarios(
     evaluation_id: str,
-    request: Request,
+    evaluation: EvaluationDB = Depends(
+        fetch_evaluation_with_permission("VIEW_EVALUATION")
+    ),
 ):
     """Fetches evaluation scenarios for a given evaluation ID.
 
@@ -249,40 +490,20 @@ async def fetch_evaluation_scenarios(
         List[EvaluationScenario]: A list of evaluation scenarios.
     """
 
-    try:
-        evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id)
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object=evaluation,
-                permission=Permission.VIEW_EVALUATION,
-            )
-            logger.debug(
-                f"User has permission to get evaluation scenarios: {has_permission}"
-            )
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
-
-        eval_scenarios = (
-            await evaluation_service.fetch_evaluation_scenarios_for_evaluation(
-                evaluation=evaluation
-            )
-        )
-        return eval_scenarios
-
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    # scenarios are streamed from a database cursor, so memory use does not
+    # grow with their number and the response_model is not re-validated
+    eval_scenarios = evaluation_service.iterate_evaluation_scenarios_for_evaluation(
+        evaluation=evaluation
+    )
+    return StreamingResponse(
+        stream_json_array(eval_scenarios), media_type="application/json"
+    )
 
 
 @router.get("/", response_model=List[Evaluation])
 async def fetch_list_evaluations(
     app_id: str,
-    request: Request,
+    app: AppDB = Depends(fetch_app_with_permission("VIEW_EVALUATION")),
 ):
     """Fetches a list of evaluations, optionally filtered by an app ID.
 
@@ -292,28 +513,17 @@ async def fetch_list_evaluations(
     Returns:
         List[Evaluation]: A list of evaluations.
     """
-    try:
-        app = await db_manager.fetch_app_by_id(app_id)
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object=app,
-                permission=Permission.VIEW_EVALUATION,
-            )
-            logger.debug(
-                f"User has permission to get list of evaluations: {has_permission}"
-            )
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
+    cache_key = cache_service.app_evaluations_key(app_id)
+    cached_evaluations = await cache_service.get_cached(cache_key)
+    if cached_evaluations is not None:
+        return cached_evaluations
 
-        return await evaluation_service.fetch_list_evaluations(app)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    evaluations = await coalesce(
+        ("evaluations", app_id),
+        lambda: evaluation_service.fetch_list_evaluations(app),
+    )
+    await cache_service.set_cached(cache_key, evaluations, EVALUATIONS_LIST_CACHE_TTL)
+    return evaluations
 
 
 @router.get(
@@ -321,7 +531,9 @@ async def fetch_list_evaluations(
 )
 async def fetch_evaluation(
     evaluation_id: str,
-    request: Request,
+    evaluation: EvaluationDB = Depends(
+        fetch_evaluation_with_permission("VIEW_EVALUATION")
+    ),
 ):
     """Fetches a single evaluation based on its ID.
 
@@ -331,32 +543,27 @@ async def fetch_evaluation(
     Returns:
         Evaluation: The fetched evaluation.
     """
-    try:
-        evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id)
-        if isCloudEE():
-            has_permission = await check_action_access(
-                user_uid=request.state.user_id,
-                object_id=evaluation_id,
-                object_type="evaluation",
-                permission=Permission.VIEW_EVALUATION,
-            )
-            logger.debug(
-                f"User has permission to get single evaluation: {has_permission}"
-            )
-            if not has_permission:
-                error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                logger.error(error_msg)
-                return JSONResponse(
-                    {"detail": error_msg},
-                    status_code=403,
-                )
-
-        return await converters.evaluation_db_to_pydantic(evaluation)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    is_terminal = is_evaluation_terminal(evaluation)
+    cache_key = cache_service.evaluation_key(evaluation_id, "evaluation")
+    if is_terminal:
+        cached_evaluation = await cache_service.get_cached(cache_key)
+        if cached_evaluation is not None:
+            return cached_evaluation
+
+    evaluation_pydantic = await converters.evaluation_db_to_pydantic(evaluation)
+    if is_terminal:
+        await cache_service.set_cached(
+            cache_key, evaluation_pydantic, EVALUATION_CACHE_TTL
+        )
+    return evaluation_pydantic
 
 
-@router.delete("/", response_model=List[str], operation_id="delete_evaluations")
+@router.delete(
+    "/",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    operation_id="delete_evaluations",
+)
 async def delete_evaluations(
     delete_evaluations: DeleteEvaluation,
     request: Request,
@@ -368,33 +575,21 @@ async def delete_evaluations(
     delete_evaluations (List[str]): The unique identifiers of the comparison tables to delete.
 
     Returns:
-    A list of the deleted comparison tables' IDs.
+    An empty response with status 204.
     """
 
-    try:
-        if isCloudEE():
-            for evaluation_id in delete_evaluations.evaluations_ids:
-                has_permission = await check_action_access(
-                    user_uid=request.state.user_id,
-                    object_id=evaluation_id,
-                    object_type="evaluation",
-                    permission=Permission.DELETE_EVALUATION,
-                )
-                logger.debug(
-                    f"User has permission to delete evaluation: {has_permission}"
-                )
-                if not has_permission:
-                    error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                    logger.error(error_msg)
-                    return JSONResponse(
-                        {"detail": error_msg},
-                        status_code=403,
-                    )
+    # linked documents are only needed by the cloud/EE permission checks
+    evaluations_ids = set(delete_evaluations.evaluations_ids)
+    evaluations = await db_manager.fetch_evaluations_by_ids(
+        list(evaluations_ids), fetch_links=IS_CLOUD_EE
+    )
+    if len(evaluations) != len(evaluations_ids):
+        raise HTTPException(status_code=404, detail="Evaluation not found")
 
-        await evaluation_service.delete_evaluations(delete_evaluations.evaluations_ids)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    await ensure_permission(request, "DELETE_EVALUATION", objects=evaluations)
+
+    await evaluation_service.delete_evaluations(evaluations=evaluations)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.post(
@@ -434,32 +629,17 @@ async def fetch_evaluation_scenarios(
     Returns:
         List[EvaluationScenario]: A list of evaluation scenarios.
     """
-    try:
-        evaluations_ids_list = evaluations_ids.split(",")
-
-        if isCloudEE():
-            for evaluation_id in evaluations_ids_list:
-                has_permission = await check_action_access(
-                    user_uid=request.state.user_id,
-                    object_id=evaluation_id,
-                    object_type="evaluation",
-                    permission=Permission.VIEW_EVALUATION,
-                )
-                logger.debug(
-                    f"User has permission to get evaluation scenarios: {has_permission}"
-                )
-                if not has_permission:
-                    error_msg = f"You do not have permission to perform this action. Please contact your organization admin."
-                    logger.error(error_msg)
-                    return JSONResponse(
-                        {"detail": error_msg},
-                        status_code=403,
-                    )
-
-        eval_scenarios = await evaluation_service.compare_evaluations_scenarios(
-            evaluations_ids_list
-        )
+    evaluations_ids_list = evaluations_ids.split(",")
+
+    await ensure_permission(
+        request,
+        "VIEW_EVALUATION",
+        object_ids=evaluations_ids_list,
+        object_type="evaluation",
+    )
+
+    eval_scenarios = await evaluation_service.compare_evaluations_scenarios(
+        evaluations_ids_list
+    )
 
-        return eval_scenarios
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+    return eval_scenarios
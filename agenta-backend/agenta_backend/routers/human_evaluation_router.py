@@ -1,3 +1,4 @@
+import logging
 from typing import List, Dict
 from fastapi.responses import JSONResponse
 from agenta_backend.utils.common import APIRouter, isCloudEE
@@ -35,6 +36,7 @@ if isCloudEE():
     )  # noqa pylint: disable-all
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post(
@@ -295,9 +297,7 @@ async def update_evaluation_scenario_router(
         )
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except UpdateEvaluationScenarioError as e:
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Failed to update evaluation scenario")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
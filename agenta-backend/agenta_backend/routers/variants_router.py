@@ -104,10 +104,7 @@ async def add_variant_from_base_and_config(
         return await converters.app_variant_db_to_output(app_variant_db)
 
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        logger.error(f"An exception occurred while adding the new variant: {e}")
+        logger.exception(f"An exception occurred while adding the new variant: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -119,10 +119,7 @@ async def start_variant(
             deployment=deployment.id,
         )
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()
-        logger.error(
+        logger.exception(
             f"Error starting Docker container for app variant {db_app_variant.app.app_name}/{db_app_variant.variant_name}: {str(e)}"
         )
         raise Exception(
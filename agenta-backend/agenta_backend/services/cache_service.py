@@ -0,0 +1,92 @@
+import json
+import logging
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+from fastapi.encoders import jsonable_encoder
+
+from agenta_backend.utils import redis_utils
+
+
+logger = logging.getLogger(__name__)
+
+
+def evaluation_key(evaluation_id: str, kind: str) -> str:
+    """Builds the cache key of a payload derived from a single evaluation.
+
+    Args:
+        evaluation_id (str): The ID of the evaluation.
+        kind (str): The kind of payload ("evaluation" or "results").
+
+    Returns:
+        str: the cache key
+    """
+
+    return f"evaluation:{evaluation_id}:{kind}"
+
+
+def app_evaluations_key(app_id: str) -> str:
+    """Builds the cache key of the list of evaluations of an app.
+
+    Args:
+        app_id (str): The ID of the app.
+
+    Returns:
+        str: the cache key
+    """
+
+    return f"evaluations:app:{app_id}"
+
+
+async def get_cached(key: str) -> Optional[Any]:
+    """Retrieves a cached payload from Redis.
+
+    Args:
+        key (str): The cache key.
+
+    Returns:
+        The cached payload, or None on a cache miss or if Redis is unavailable.
+    """
+
+    try:
+        cached_data = await redis_utils.async_redis_connection().get(key)
+    except RedisError as exc:
+        logger.error("Could not read %s from cache: %s", key, exc)
+        return None
+
+    if cached_data is None:
+        return None
+    return json.loads(cached_data)
+
+
+async def set_cached(key: str, value: Any, ttl: int) -> None:
+    """Caches a payload in Redis.
+
+    Args:
+        key (str): The cache key.
+        value (Any): The payload to cache, it must be JSON encodable by FastAPI.
+        ttl (int): The number of seconds after which the payload expires.
+    """
+
+    try:
+        await redis_utils.async_redis_connection().set(
+            key, json.dumps(jsonable_encoder(value)), ex=ttl
+        )
+    except RedisError as exc:
+        logger.error("Could not write %s to cache: %s", key, exc)
+
+
+async def invalidate(*keys: str) -> None:
+    """Drops cached payloads from Redis.
+
+    Args:
+        *keys (str): The cache keys to drop.
+    """
+
+    if not keys:
+        return
+
+    try:
+        await redis_utils.async_redis_connection().delete(*keys)
+    except RedisError as exc:
+        logger.error("Could not invalidate %s from cache: %s", keys, exc)
@@ -1583,6 +1583,24 @@ async def fetch_evaluation_by_id(evaluation_id: str) -> Optional[EvaluationDB]:
     return evaluation
 
 
+async def fetch_evaluations_by_ids(
+    evaluation_ids: List[str], fetch_links: bool = False
+) -> List[EvaluationDB]:
+    """Fetches evaluations by their IDs in a single query.
+    Args:
+        evaluation_ids (List[str]): The IDs of the evaluations to fetch.
+        fetch_links (bool): Whether to also fetch the linked documents.
+    Returns:
+        List[EvaluationDB]: The fetched evaluations.
+    """
+    assert evaluation_ids is not None, "evaluation_ids cannot be None"
+    ids = [ObjectId(evaluation_id) for evaluation_id in evaluation_ids]
+    evaluations = await EvaluationDB.find(
+        In(EvaluationDB.id, ids), fetch_links=fetch_links
+    ).to_list()
+    return evaluations
+
+
 async def fetch_human_evaluation_by_id(
     evaluation_id: str,
 ) -> Optional[HumanEvaluationDB]:
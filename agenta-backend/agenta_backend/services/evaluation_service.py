@@ -1,11 +1,11 @@
 import logging
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
 
 from agenta_backend.models import converters
-from agenta_backend.services import db_manager
+from agenta_backend.services import db_manager, cache_service
 from agenta_backend.utils.common import isCloudEE
 
 from agenta_backend.models.api.evaluation_model import (
@@ -42,13 +42,14 @@ else:
     )
 
 from agenta_backend.models.db_models import (
+    EvaluationIdView,
     HumanEvaluationScenarioInput,
     HumanEvaluationScenarioOutput,
     Result,
 )
 
 from beanie.operators import In
-from beanie import PydanticObjectId as ObjectId
+from beanie import Link, PydanticObjectId as ObjectId
 
 
 logger = logging.getLogger(__name__)
@@ -245,6 +246,26 @@ async def fetch_evaluation_scenarios_for_evaluation(
     return eval_scenarios
 
 
+async def iterate_evaluation_scenarios_for_evaluation(
+    evaluation: EvaluationDB,
+) -> AsyncIterator[EvaluationScenario]:
+    """
+    Iterate over the evaluation scenarios of an evaluation, reading them from a \
+        database cursor instead of loading them all at once.
+
+    Args:
+        evaluation (EvaluationDB): The evaluation instance.
+
+    Yields:
+        EvaluationScenario: The evaluation scenarios, one at a time.
+    """
+    evaluation_id = str(evaluation.id)
+    async for scenario in EvaluationScenarioDB.find(
+        EvaluationScenarioDB.evaluation.id == ObjectId(evaluation.id)
+    ):
+        yield converters.evaluation_scenario_db_to_pydantic(scenario, evaluation_id)
+
+
 async def fetch_human_evaluation_scenarios_for_evaluation(
     human_evaluation: HumanEvaluationDB,
 ) -> List[HumanEvaluationScenario]:
@@ -423,19 +444,50 @@ async def delete_human_evaluations(evaluation_ids: List[str]) -> None:
         await evaluation.delete()
 
 
-async def delete_evaluations(evaluation_ids: List[str]) -> None:
+async def delete_evaluations(
+    evaluation_ids: List[str] = None, evaluations: List[EvaluationDB] = None
+) -> None:
     """
     Delete evaluations by their IDs.
 
     Args:
         evaluation_ids (List[str]): A list of evaluation IDs.
+        evaluations (List[EvaluationDB]): The evaluation instances, if already fetched.
 
     Raises:
         HTTPException: If evaluation not found or access denied.
     """
-    for evaluation_id in evaluation_ids:
-        evaluation = await db_manager.fetch_evaluation_by_id(evaluation_id)
-        await evaluation.delete()
+    assert (
+        evaluation_ids is not None or evaluations is not None
+    ), "Please provide either evaluation_ids or evaluations"
+
+    if evaluations is None:
+        evaluations = await db_manager.fetch_evaluations_by_ids(evaluation_ids)
+
+    if not evaluations:
+        return
+
+    await EvaluationDB.find(
+        In(EvaluationDB.id, [evaluation.id for evaluation in evaluations])
+    ).delete()
+
+    # the app link is not fetched when the evaluations are fetched without links
+    app_ids = {
+        str(
+            evaluation.app.ref.id
+            if isinstance(evaluation.app, Link)
+            else evaluation.app.id
+        )
+        for evaluation in evaluations
+    }
+    await cache_service.invalidate(
+        *[cache_service.app_evaluations_key(app_id) for app_id in app_ids],
+        *[
+            cache_service.evaluation_key(str(evaluation.id), kind)
+            for evaluation in evaluations
+            for kind in ("evaluation", "results")
+        ],
+    )
 
 
 async def create_new_human_evaluation(
@@ -654,22 +706,32 @@ def remove_duplicates(csvdata):
     return unique_entries
 
 
-async def fetch_evaluations_by_resource(resource_type: str, resource_ids: List[str]):
-    ids = list(map(lambda x: ObjectId(x), resource_ids))
+async def fetch_evaluations_by_resource(
+    resource_type: str, resource_ids: List[str]
+) -> List[EvaluationIdView]:
+    """
+    Fetch the IDs of the evaluations using any of the given resources.
+
+    Args:
+        resource_type (str): The type of the resources.
+        resource_ids (List[str]): The IDs of the resources.
+
+    Raises:
+        HTTPException: If the resource type is not supported.
+
+    Returns:
+        List[EvaluationIdView]: The IDs of the evaluations.
+    """
+    ids = [ObjectId(resource_id) for resource_id in resource_ids]
     if resource_type == "variant":
-        res = await EvaluationDB.find(In(EvaluationDB.variant, ids)).to_list()
+        query = In(EvaluationDB.variant, ids)
     elif resource_type == "testset":
-        res = await EvaluationDB.find(In(EvaluationDB.testset.id, ids)).to_list()
+        query = In(EvaluationDB.testset.id, ids)
     elif resource_type == "evaluator_config":
-        res = await EvaluationDB.find(
-            In(
-                EvaluationDB.evaluators_configs,
-                ids,
-            )
-        ).to_list()
+        query = In(EvaluationDB.evaluators_configs, ids)
     else:
         raise HTTPException(
             status_code=400,
             detail=f"resource_type {resource_type} is not supported",
         )
-    return res
+    return await EvaluationDB.find(query).project(EvaluationIdView).to_list()
@@ -0,0 +1,190 @@
+import json
+from types import SimpleNamespace
+from datetime import datetime, timezone
+
+import pytest
+from beanie import Link, PydanticObjectId
+from bson import DBRef
+from redis.exceptions import RedisError
+
+from agenta_backend.models import converters
+from agenta_backend.models.db_models import AppDB
+from agenta_backend.models.api.evaluation_model import EvaluationStatusEnum
+from agenta_backend.routers import evaluation_router
+from agenta_backend.services import cache_service, evaluation_service
+from agenta_backend.utils import redis_utils
+
+
+class FakeRedis:
+    """Keeps the cached payloads in memory, or fails every command."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.store = {}
+
+    def check_available(self):
+        if not self.available:
+            raise RedisError("Redis is unavailable")
+
+    async def get(self, key):
+        self.check_available()
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.check_available()
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        self.check_available()
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(redis_utils, "async_redis_client", redis)
+    return redis
+
+
+def fake_evaluation(status, evaluation_id=None, app_id=None):
+    return SimpleNamespace(
+        id=evaluation_id or PydanticObjectId(),
+        app=SimpleNamespace(id=app_id or PydanticObjectId()),
+        status=SimpleNamespace(value=status),
+        aggregated_results=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_round_trip(fake_redis):
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    await cache_service.set_cached("key", {"created_at": created_at}, ttl=5)
+
+    assert await cache_service.get_cached("key") == {
+        "created_at": "2024-01-01T00:00:00+00:00"
+    }
+    assert await cache_service.get_cached("missing") is None
+
+    await cache_service.invalidate("key")
+    assert await cache_service.get_cached("key") is None
+
+
+@pytest.mark.asyncio
+async def test_cache_treats_redis_errors_as_misses(fake_redis):
+    fake_redis.available = False
+
+    await cache_service.set_cached("key", {"id": "1"}, ttl=5)
+    await cache_service.invalidate("key")
+    assert await cache_service.get_cached("key") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, cached",
+    [
+        (EvaluationStatusEnum.EVALUATION_STARTED, False),
+        (EvaluationStatusEnum.EVALUATION_FINISHED, True),
+    ],
+)
+async def test_fetch_evaluation_caches_finished_evaluations(
+    fake_redis, monkeypatch, status, cached
+):
+    calls = []
+
+    async def evaluation_db_to_pydantic(evaluation):
+        calls.append(1)
+        return {"id": str(evaluation.id), "status": 1}
+
+    monkeypatch.setattr(
+        converters, "evaluation_db_to_pydantic", evaluation_db_to_pydantic
+    )
+
+    evaluation = fake_evaluation(status)
+    evaluation_id = str(evaluation.id)
+    for _ in range(2):
+        response = await evaluation_router.fetch_evaluation(evaluation_id, evaluation)
+        assert response == {"id": evaluation_id, "status": 1}
+
+    key = cache_service.evaluation_key(evaluation_id, "evaluation")
+    assert (key in fake_redis.store) is cached
+    assert len(calls) == (1 if cached else 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, cached",
+    [
+        (EvaluationStatusEnum.EVALUATION_INITIALIZED, False),
+        (EvaluationStatusEnum.EVALUATION_FAILED, True),
+    ],
+)
+async def test_fetch_evaluation_results_caches_finished_evaluations(
+    fake_redis, monkeypatch, status, cached
+):
+    calls = []
+
+    async def aggregated_result_to_pydantic(results):
+        calls.append(1)
+        return []
+
+    monkeypatch.setattr(
+        converters, "aggregated_result_to_pydantic", aggregated_result_to_pydantic
+    )
+
+    evaluation = fake_evaluation(status)
+    evaluation_id = str(evaluation.id)
+    for _ in range(2):
+        response = await evaluation_router.fetch_evaluation_results(
+            evaluation_id, evaluation
+        )
+        assert response == {"results": [], "evaluation_id": evaluation_id}
+
+    key = cache_service.evaluation_key(evaluation_id, "results")
+    assert (key in fake_redis.store) is cached
+    assert len(calls) == (1 if cached else 2)
+
+
+@pytest.mark.asyncio
+async def test_delete_evaluations_invalidates_their_cache(fake_redis, monkeypatch):
+    deleted = []
+
+    class FakeQuery:
+        async def delete(self):
+            deleted.append(1)
+
+    class FakeEvaluationDB:
+        id = "_id"
+
+        @staticmethod
+        def find(*args, **kwargs):
+            return FakeQuery()
+
+    monkeypatch.setattr(evaluation_service, "EvaluationDB", FakeEvaluationDB)
+
+    app_id = PydanticObjectId()
+    status = EvaluationStatusEnum.EVALUATION_FINISHED
+    evaluation = fake_evaluation(status, app_id=app_id)
+    # evaluations fetched without their links keep a Link to the app
+    linked_evaluation = fake_evaluation(status)
+    linked_evaluation.app = Link(DBRef("app_db", app_id), AppDB)
+    other_evaluation = fake_evaluation(status)
+
+    evaluations = [evaluation, linked_evaluation, other_evaluation]
+    keys = [
+        cache_service.app_evaluations_key(str(app_id)),
+        cache_service.app_evaluations_key(str(other_evaluation.app.id)),
+        *[
+            cache_service.evaluation_key(str(cached_evaluation.id), kind)
+            for cached_evaluation in evaluations
+            for kind in ("evaluation", "results")
+        ],
+    ]
+    unrelated_key = cache_service.evaluation_key(str(PydanticObjectId()), "results")
+    for key in [*keys, unrelated_key]:
+        fake_redis.store[key] = json.dumps({})
+
+    await evaluation_service.delete_evaluations(evaluations=evaluations)
+
+    assert deleted == [1]
+    assert list(fake_redis.store) == [unrelated_key]
@@ -0,0 +1,50 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from agenta_backend.utils.common import APIRouter, ServerErrorRoute
+
+
+router = APIRouter(route_class=ServerErrorRoute)
+
+
+@router.get("/http_error/")
+async def raise_http_error():
+    raise HTTPException(status_code=400, detail="resource_type is not supported")
+
+
+@router.get("/unhandled_error/")
+async def raise_unhandled_error():
+    raise ValueError("something went wrong")
+
+
+@router.get("/validated/")
+async def validate_query(count: int):
+    return {"count": count}
+
+
+app = FastAPI()
+app.include_router(router)
+client = TestClient(app)
+
+
+def test_server_error_route_keeps_http_errors():
+    response = client.get("/http_error/")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "resource_type is not supported"}
+
+
+def test_server_error_route_reports_unhandled_errors_as_500():
+    response = client.get("/unhandled_error/")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "something went wrong"}
+
+
+def test_server_error_route_keeps_validation_errors():
+    response = client.get("/validated/", params={"count": "not a number"})
+    assert response.status_code == 422
+
+
+def test_server_error_route_returns_responses():
+    response = client.get("/validated/", params={"count": 3})
+    assert response.status_code == 200
+    assert response.json() == {"count": 3}
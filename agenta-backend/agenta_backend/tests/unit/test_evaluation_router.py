@@ -0,0 +1,285 @@
+import json
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from agenta_backend.routers import evaluation_router
+from agenta_backend.routers.evaluation_router import (
+    coalesce,
+    inflight_fetches,
+    stream_json_array,
+)
+
+
+async def async_iterate(items):
+    for item in items:
+        yield item
+
+
+async def collect_stream(items):
+    chunks = [chunk async for chunk in stream_json_array(async_iterate(items))]
+    return b"".join(chunks)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "items",
+    [
+        [],
+        [{"id": "1"}],
+        [{"id": "1"}, {"id": "2", "output": "été"}, {"id": "3", "score": 0.5}],
+    ],
+)
+async def test_stream_json_array(items):
+    body = await collect_stream(items)
+    expected = json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+    assert json.loads(body) == items
+    assert body == expected.encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_stream_json_array_rejects_nan():
+    with pytest.raises(ValueError):
+        await collect_stream([{"score": float("nan")}])
+
+
+@pytest.mark.asyncio
+async def test_coalesce_runs_concurrent_fetches_once():
+    calls = []
+    release = asyncio.Event()
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return "evaluation"
+
+    waiters = [
+        asyncio.ensure_future(coalesce(("evaluation", "1"), fetch)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["evaluation"] * 3
+    assert len(calls) == 1
+    assert ("evaluation", "1") not in inflight_fetches
+
+
+@pytest.mark.asyncio
+async def test_coalesce_keeps_fetching_when_a_caller_is_cancelled():
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "evaluation"
+
+    cancelled = asyncio.ensure_future(coalesce(("evaluation", "2"), fetch))
+    waiting = asyncio.ensure_future(coalesce(("evaluation", "2"), fetch))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == "evaluation"
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+
+@pytest.mark.asyncio
+async def test_coalesce_raises_fetch_errors_to_every_caller():
+    calls = []
+
+    async def failing_fetch():
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise RuntimeError("database unavailable")
+
+    results = await asyncio.gather(
+        coalesce(("evaluation", "3"), failing_fetch),
+        coalesce(("evaluation", "3"), failing_fetch),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 1
+
+    # the failed fetch is not kept, the next request fetches again
+    async def fetch():
+        return "evaluation"
+
+    assert await coalesce(("evaluation", "3"), fetch) == "evaluation"
+
+
+def fake_request():
+    return SimpleNamespace(state=SimpleNamespace(user_id="user"))
+
+
+def patch_check_action_access(monkeypatch, check_action_access):
+    # check_action_access is only imported in cloud/EE deployments
+    monkeypatch.setattr(
+        evaluation_router, "check_action_access", check_action_access, raising=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_bulk_action_access_stops_at_first_denial(monkeypatch):
+    slow_check_cancelled = asyncio.Event()
+
+    async def check_action_access(user_uid, object_id, **kwargs):
+        if object_id == "denied":
+            return False
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            slow_check_cancelled.set()
+            raise
+        return True
+
+    patch_check_action_access(monkeypatch, check_action_access)
+
+    has_permission = await asyncio.wait_for(
+        evaluation_router.check_bulk_action_access(
+            request=fake_request(),
+            permission=None,
+            object_ids=["slow", "denied"],
+            object_type="evaluation",
+        ),
+        timeout=5,
+    )
+    await asyncio.sleep(0)
+
+    assert has_permission is False
+    assert slow_check_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_check_bulk_action_access_allows_when_all_allowed(monkeypatch):
+    checked = []
+
+    async def check_action_access(user_uid, object, **kwargs):
+        checked.append((user_uid, object.id))
+        return True
+
+    patch_check_action_access(monkeypatch, check_action_access)
+
+    has_permission = await evaluation_router.check_bulk_action_access(
+        request=fake_request(),
+        permission=None,
+        objects=[SimpleNamespace(id="first"), SimpleNamespace(id="second")],
+    )
+    assert has_permission is True
+    assert sorted(checked) == [("user", "first"), ("user", "second")]
+
+
+@pytest.mark.asyncio
+async def test_check_bulk_action_access_checks_each_object_once(monkeypatch):
+    checked = []
+
+    async def check_action_access(user_uid, object_id=None, object=None, **kwargs):
+        checked.append(object_id or object.id)
+        return True
+
+    patch_check_action_access(monkeypatch, check_action_access)
+
+    assert await evaluation_router.check_bulk_action_access(
+        request=fake_request(),
+        permission=None,
+        object_ids=["first", "first", "second"],
+        object_type="evaluation",
+    )
+    assert await evaluation_router.check_bulk_action_access(
+        request=fake_request(),
+        permission=None,
+        objects=[SimpleNamespace(id="third"), SimpleNamespace(id="third")],
+    )
+    assert sorted(checked) == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_check_bulk_action_access_cancels_pending_on_error(monkeypatch):
+    slow_check_cancelled = asyncio.Event()
+
+    async def check_action_access(user_uid, object_id, **kwargs):
+        if object_id == "failing":
+            raise RuntimeError("permissions backend unavailable")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            slow_check_cancelled.set()
+            raise
+        return True
+
+    patch_check_action_access(monkeypatch, check_action_access)
+
+    with pytest.raises(RuntimeError):
+        await evaluation_router.check_bulk_action_access(
+            request=fake_request(),
+            permission=None,
+            object_ids=["slow", "failing"],
+            object_type="evaluation",
+        )
+    await asyncio.sleep(0)
+
+    assert slow_check_cancelled.is_set()
+
+
+@pytest.fixture
+def cloud_ee(monkeypatch):
+    # the Permission enum is only imported in cloud/EE deployments
+    monkeypatch.setattr(evaluation_router, "IS_CLOUD_EE", True)
+    monkeypatch.setattr(
+        evaluation_router,
+        "Permission",
+        {"VIEW_EVALUATION": "view_evaluation"},
+        raising=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_permission_checks_nothing_outside_cloud_ee(monkeypatch):
+    async def check_action_access(**kwargs):
+        raise AssertionError("no permission check expected")
+
+    patch_check_action_access(monkeypatch, check_action_access)
+    monkeypatch.setattr(evaluation_router, "IS_CLOUD_EE", False)
+
+    await evaluation_router.ensure_permission(
+        fake_request(), "VIEW_EVALUATION", object_id="1", object_type="evaluation"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "target",
+    [
+        {"object": SimpleNamespace(id="1")},
+        {"object_ids": ["1", "2"], "object_type": "evaluation"},
+    ],
+)
+async def test_ensure_permission_denies_with_403(monkeypatch, cloud_ee, target):
+    checked = []
+
+    async def check_action_access(user_uid, permission, **kwargs):
+        checked.append((user_uid, permission))
+        return False
+
+    patch_check_action_access(monkeypatch, check_action_access)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await evaluation_router.ensure_permission(
+            fake_request(), "VIEW_EVALUATION", **target
+        )
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == evaluation_router.PERMISSION_DENIED_MESSAGE
+    assert checked and set(checked) == {("user", "view_evaluation")}
+
+
+@pytest.mark.asyncio
+async def test_ensure_permission_allows(monkeypatch, cloud_ee):
+    async def check_action_access(user_uid, permission, object):
+        return True
+
+    patch_check_action_access(monkeypatch, check_action_access)
+
+    await evaluation_router.ensure_permission(
+        fake_request(), "VIEW_EVALUATION", object=SimpleNamespace(id="1")
+    )
@@ -273,6 +273,72 @@ async def test_evaluation_scenario_match_evaluation_testset_length():
     assert evaluation_scenario_count == len(evaluation.testset.csvdata)
 
 
+@pytest.mark.asyncio
+async def test_fetch_evaluation_ids_by_resource():
+    evaluations = await EvaluationDB.find().to_list()
+    evaluation = evaluations[0]
+
+    response = await test_client.get(
+        f"{BACKEND_API_HOST}/evaluations/by_resource/",
+        params={
+            "app_id": str(evaluation.app.ref.id),
+            "resource_type": "variant",
+            "resource_ids": [str(evaluation.variant)],
+        },
+        timeout=timeout,
+    )
+
+    assert response.status_code == 200
+    assert str(evaluation.id) in response.json()
+
+
+@pytest.mark.asyncio
+async def test_fetch_evaluation_ids_by_unsupported_resource():
+    evaluations = await EvaluationDB.find().to_list()
+    evaluation = evaluations[0]
+
+    response = await test_client.get(
+        f"{BACKEND_API_HOST}/evaluations/by_resource/",
+        params={
+            "app_id": str(evaluation.app.ref.id),
+            "resource_type": "unsupported",
+            "resource_ids": [str(evaluation.variant)],
+        },
+        timeout=timeout,
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_delete_unknown_evaluation():
+    response = await test_client.request(
+        "DELETE",
+        f"{BACKEND_API_HOST}/evaluations/",
+        json={"evaluations_ids": ["65c1d4b2a5e3f1b5d8e9a0c7"]},
+        timeout=timeout,
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_evaluations():
+    evaluations = await EvaluationDB.find().to_list()
+    evaluations_ids = [str(evaluation.id) for evaluation in evaluations]
+
+    response = await test_client.request(
+        "DELETE",
+        f"{BACKEND_API_HOST}/evaluations/",
+        json={"evaluations_ids": evaluations_ids},
+        timeout=timeout,
+    )
+
+    assert response.status_code == 204
+    assert response.content == b""
+    assert await EvaluationDB.find().count() == 0
+
+
 @pytest.mark.asyncio
 async def test_remove_running_template_app_container():
     import docker
@@ -3,7 +3,10 @@ import logging
 from typing import Any, Callable
 
 from fastapi.types import DecoratedCallable
-from fastapi import APIRouter as FastAPIRouter
+from fastapi.routing import APIRoute
+from fastapi.exceptions import RequestValidationError
+from fastapi import APIRouter as FastAPIRouter, HTTPException, Request, Response
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from sentry_sdk import capture_exception
 
 logger = logging.getLogger(__name__)
@@ -51,6 +54,27 @@ class APIRouter(FastAPIRouter):
         return decorator
 
 
+class ServerErrorRoute(APIRoute):
+    """
+    Extends the APIRoute class to report the unhandled exceptions of a route as 500 HTTP errors carrying the exception message.
+
+    HTTP errors and request validation errors raised by the route propagate untouched.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        route_handler = super().get_route_handler()
+
+        async def server_error_route_handler(request: Request) -> Response:
+            try:
+                return await route_handler(request)
+            except (StarletteHTTPException, RequestValidationError):
+                raise
+            except Exception as exc:
+                raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        return server_error_route_handler
+
+
 def isCloudEE():
     return os.environ["FEATURE_FLAG"] in ["cloud", "ee", "cloud-dev"]
 
@@ -1,8 +1,13 @@
 import os
 import redis
+import redis.asyncio as aioredis
 from redis.exceptions import ConnectionError
 
 
+# shared by the whole process so that its connection pool is reused
+async_redis_client = None
+
+
 def redis_connection() -> redis.Redis:
     """Returns a client object for connecting to a Redis service specified \
         by the REDIS_URL environment variable.
@@ -19,3 +24,19 @@ def redis_connection() -> redis.Redis:
     except ConnectionError:
         raise ConnectionError("Could not connect to redis service.")
     return redis_client
+
+
+def async_redis_connection() -> aioredis.Redis:
+    """Returns the asyncio client shared by the process for connecting to the \
+        Redis service specified by the REDIS_URL environment variable.
+
+    The client is created on first use and connects lazily, keeping its
+    connections in a pool reused by every later call.
+
+    :return: an asyncio Redis client object.
+    """
+
+    global async_redis_client
+    if async_redis_client is None:
+        async_redis_client = aioredis.from_url(url=os.environ.get("REDIS_URL", None))
+    return async_redis_client